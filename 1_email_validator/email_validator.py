@@ -4,15 +4,118 @@ Email Validator - проверка валидности email-адресов
 Проверяет: MX-записи домена + SMTP Handshake (существование пользователя)
 """
 
-import re
-import smtplib
+import asyncio
+import logging
+import os
+import string
+import sys
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+import dns.asyncresolver
 import dns.resolver
-from typing import List, Tuple
+from typing import DefaultDict, Dict, List, Optional, Tuple
 from colorama import Fore, Style, init
 
+try:
+    import uvloop
+except ImportError:  # uvloop недоступен на Windows
+    uvloop = None
+
 # Инициализация colorama для цветного вывода
 init(autoreset=True)
 
+logger = logging.getLogger(__name__)
+
+# Допустимые символы локальной части, домена и TLD.
+# Используются как таблицы удаления для bytes.translate: если после удаления
+# допустимых символов что-то осталось - в строке есть запрещённый символ.
+_LOCAL_CHARS = (string.ascii_letters + string.digits + '._%+-').encode('ascii')
+_DOMAIN_CHARS = (string.ascii_letters + string.digits + '.-').encode('ascii')
+_TLD_CHARS = string.ascii_letters.encode('ascii')
+_MAX_EMAIL_LENGTH = 254
+
+# Параметры кэша MX-записей
+_MX_CACHE_SIZE = 4096
+_MX_NEGATIVE_TTL = 300  # сколько помнить домены без MX (секунды)
+
+# Параметры кэша полных результатов проверки
+_RESULT_CACHE_SIZE = 50000
+_RESULT_CACHE_MAX_TTL = 3600  # секунды; не дольше, чем живёт MX-запись домена
+
+# Общий асинхронный DNS-резолвер для всех валидаторов процесса (создаётся в _get_resolver)
+_RESOLVER: Optional[dns.asyncresolver.Resolver] = None
+
+# Сколько адресов проверяется одновременно (не перегружаем локальный резолвер)
+_MAX_CONCURRENCY = 200
+
+# Параметры SMTP-проверки
+_SMTP_PORT = 25
+_HELO_HOSTNAME = 'polza-validator.com'
+_MAIL_FROM = 'validator@polza-validator.com'
+# Команды SMTP собираются один раз при загрузке модуля
+_EHLO_CMD = f'EHLO {_HELO_HOSTNAME}\r\n'.encode('ascii')
+_HELO_CMD = f'HELO {_HELO_HOSTNAME}\r\n'.encode('ascii')
+_MAIL_FROM_CMD = f'MAIL FROM:<{_MAIL_FROM}>\r\n'.encode('ascii')
+_RSET_CMD = b'RSET\r\n'
+_QUIT_CMD = b'QUIT\r\n'
+_MAX_RCPT_PER_TRANSACTION = 100  # RFC 5321 гарантирует поддержку минимум 100 получателей
+_MAX_SESSIONS_PER_MX = 4  # одновременных соединений с одним MX-сервером
+
+
+class _SMTPError(Exception):
+    """Неожиданный ответ SMTP-сервера"""
+
+
+class _SMTPConnectError(_SMTPError):
+    """Сервер не принял соединение (приветствие не 220)"""
+
+
+def _get_resolver() -> dns.asyncresolver.Resolver:
+    """
+    Общий DNS-резолвер, создаётся при первом EmailValidator()
+    
+    Конфигурация системы (resolv.conf) читается только здесь, поэтому импорт
+    модуля не требует рабочего DNS, например для validate_email_format.
+    """
+    global _RESOLVER
+    if _RESOLVER is None:
+        resolver = dns.asyncresolver.Resolver(configure=True)
+        resolver.timeout = 5
+        resolver.lifetime = 5
+        # EDNS(0) поднимает лимит UDP-ответа с 512 байт, чтобы не уходить в TCP при усечении;
+        # 1232 байта - рекомендация DNS Flag Day 2020 (без IP-фрагментации)
+        resolver.use_edns(0, 0, 1232)
+        # Встроенный LRUCache учитывает TTL записей и общий для всех экземпляров EmailValidator
+        resolver.cache = dns.resolver.LRUCache(10000)
+        _RESOLVER = resolver
+    return _RESOLVER
+
+
+def _scan_email(email: str) -> bool:
+    """Проверка формата email за один линейный проход"""
+    # RFC 5321: адрес длиннее 254 символов не может быть доставлен - отсекаем до разбора
+    if len(email) > _MAX_EMAIL_LENGTH or not email.isascii():
+        return False
+    buf = email.encode('ascii')
+
+    at_pos = buf.find(b'@')
+    if at_pos <= 0:
+        return False
+
+    # Последняя точка домена отделяет TLD: перед ней минимум 1 символ, после - минимум 2
+    last_dot = buf.rfind(b'.')
+    if last_dot <= at_pos + 1 or len(buf) - last_dot < 3:
+        return False
+
+    # Второй '@' не входит ни в одну таблицу и отсекается проверкой домена
+    return not (
+        buf[:at_pos].translate(None, _LOCAL_CHARS)
+        or buf[at_pos + 1:].translate(None, _DOMAIN_CHARS)
+        or buf[last_dot + 1:].translate(None, _TLD_CHARS)
+    )
+
 
 class EmailValidator:
     """Класс для валидации email-адресов через MX и SMTP проверку"""
@@ -23,124 +126,520 @@ class EmailValidator:
             timeout: Таймаут для SMTP-соединения (секунды)
         """
         self.timeout = timeout
-        self.dns_resolver = dns.resolver.Resolver()
-        self.dns_resolver.timeout = 5
-        self.dns_resolver.lifetime = 5
+        self.dns_resolver = _get_resolver()
+        # domain -> (момент истечения по time.monotonic(), MX-серверы)
+        self._mx_cache: 'OrderedDict[str, Tuple[float, Tuple[str, ...]]]' = OrderedDict()
+        # Запросы в процессе выполнения: параллельные проверки одного домена ждут один запрос
+        self._mx_pending: Dict[str, asyncio.Future] = {}
+        # email в нижнем регистре -> (момент истечения, результат проверки)
+        self._result_cache: 'OrderedDict[str, Tuple[float, dict]]' = OrderedDict()
     
     def validate_email_format(self, email: str) -> bool:
-        """Проверка формата email через regex"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        """
+        Проверка формата email за один линейный проход (без regex и backtracking)
+
+        Эквивалентно шаблону ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$
+        """
+        return _scan_email(email)
     
-    def get_mx_records(self, domain: str) -> List[str]:
+    def validate_formats(self, emails: List[str]) -> List[bool]:
+        """Проверка формата для списка email-адресов"""
+        return list(map(_scan_email, emails))
+    
+    async def get_mx_records(self, domain: str) -> List[str]:
         """
-        Получение MX-записей домена
+        Получение MX-записей домена (с кэшированием на время TTL записи)
         
         Returns:
             Список MX-серверов, отсортированных по приоритету
         """
+        domain = domain.lower()
+        cached = self._mx_cache.get(domain)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._mx_cache.move_to_end(domain)
+                return list(cached[1])
+            # Истёкшая запись не должна занимать место в кэше
+            del self._mx_cache[domain]
+        
+        pending = self._mx_pending.get(domain)
+        if pending is not None:
+            return list(await pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._mx_pending[domain] = future
         try:
-            mx_records = dns.resolver.resolve(domain, 'MX')
-            # Сортируем по приоритету (preference)
-            mx_hosts = sorted(
-                [(r.preference, str(r.exchange).rstrip('.')) for r in mx_records],
-                key=lambda x: x[0]
+            mx_hosts, ttl = await self._resolve_mx(domain)
+            future.set_result(mx_hosts)
+        finally:
+            del self._mx_pending[domain]
+            if not future.done():
+                future.cancel()
+        
+        if ttl:
+            self._mx_cache[domain] = (time.monotonic() + ttl, mx_hosts)
+            self._mx_cache.move_to_end(domain)
+            if len(self._mx_cache) > _MX_CACHE_SIZE:
+                # Вытесняем запись, к которой дольше всего не обращались
+                self._mx_cache.popitem(last=False)
+        return list(mx_hosts)
+    
+    async def _resolve_mx(self, domain: str) -> Tuple[Tuple[str, ...], int]:
+        """
+        DNS-запрос MX-записей без кэша
+        
+        Returns:
+            (mx_hosts, ttl): ttl=0 если результат нельзя кэшировать
+        """
+        try:
+            mx_records = await self.dns_resolver.resolve(domain, 'MX')
+            # Сортируем по приоритету (preference); имена интернируются - одинаковые
+            # MX разных доменов становятся одним объектом строки
+            mx_hosts = tuple(
+                sys.intern(str(r.exchange).rstrip('.'))
+                for r in sorted(mx_records, key=attrgetter('preference'))
             )
-            return [host for _, host in mx_hosts]
-        except (dns.resolver.NXDOMAIN, dns.resolver.NoNameservers):
-            return []
-        except dns.resolver.NoAnswer:
-            return []
+            # При попадании в LRUCache резолвера rrset.ttl - исходный TTL, а не остаток,
+            # поэтому считаем оставшееся время по expiration ответа
+            return mx_hosts, max(0, int(mx_records.expiration - time.time()))
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            return (), _MX_NEGATIVE_TTL
+        except dns.resolver.NoNameservers:
+            # SERVFAIL / все серверы недоступны - сбой временный, не кэшируем
+            return (), 0
         except Exception as e:
-            print(f"{Fore.YELLOW}⚠️  Ошибка при получении MX для {domain}: {e}")
-            return []
+            logger.warning("⚠️  Ошибка при получении MX для %s: %s", domain, e)
+            return (), 0
     
-    def smtp_verify(self, email: str, mx_host: str) -> Tuple[bool, str]:
+    async def smtp_verify(self, email: str, mx_host: str) -> Tuple[bool, str]:
         """
         SMTP Handshake - проверка существования email без отправки письма
         
         Returns:
             (exists, message): exists=True если адрес существует
         """
+        exists, message, _ = (await self.smtp_verify_batch(mx_host, [email]))[email]
+        return exists, message
+    
+    async def smtp_verify_batch(self, mx_host: str,
+                                emails: List[str]) -> Dict[str, Tuple[bool, str, Optional[int]]]:
+        """
+        SMTP Handshake для группы адресов через одно соединение с MX-сервером
+        
+        HELO и MAIL FROM выполняются один раз, затем RCPT TO для каждого адреса.
+        
+        Returns:
+            {email: (exists, message, code)} для каждого адреса из emails;
+            code - код ответа на RCPT TO или None, если ответа не было (ошибка соединения)
+        """
+        results: Dict[str, Tuple[bool, str, Optional[int]]] = {}
         try:
             # Подключаемся к SMTP серверу
-            server = smtplib.SMTP(timeout=self.timeout)
-            server.set_debuglevel(0)
-            server.connect(mx_host)
-            server.helo('polza-validator.com')  # HELO - представляемся
-            server.mail('validator@polza-validator.com')  # MAIL FROM
-            
-            # RCPT TO - проверяем существование получателя
-            code, message = server.rcpt(email)
-            server.quit()
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(mx_host, _SMTP_PORT), self.timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            error = "не удалось подключиться к серверу"
+        else:
+            try:
+                await self._smtp_session(reader, writer, emails, results)
+                return results
+            except _SMTPConnectError:
+                error = "не удалось подключиться к серверу"
+            except (ConnectionError, asyncio.IncompleteReadError):
+                error = "сервер разорвал соединение"
+            except asyncio.TimeoutError:
+                error = "сервер не ответил вовремя"
+            except Exception as e:
+                error = f"ошибка SMTP: {str(e)[:50]}"
+            finally:
+                writer.close()
+        
+        # Адреса, до которых не дошла очередь, получают ошибку соединения
+        for email in emails:
+            results.setdefault(email, (False, error, None))
+        return results
+    
+    async def _smtp_session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                            emails: List[str], results: Dict[str, Tuple[bool, str, Optional[int]]]):
+        """Проверка адресов в уже открытом SMTP-соединении"""
+        code, _ = await self._smtp_reply(reader)
+        if code != 220:
+            raise _SMTPConnectError(code)
+        
+        # EHLO нужен, чтобы узнать о поддержке PIPELINING; старые серверы понимают только HELO
+        writer.write(_EHLO_CMD)
+        code, lines = await self._smtp_reply(reader)
+        if code == 250:
+            pipelining = any(line[4:].strip().upper() == b'PIPELINING' for line in lines)
+        else:
+            writer.write(_HELO_CMD)
+            code, _ = await self._smtp_reply(reader)
+            if code != 250:
+                raise _SMTPError(f"HELO отклонён (код {code})")
+            pipelining = False
+        
+        for start in range(0, len(emails), _MAX_RCPT_PER_TRANSACTION):
+            batch = emails[start:start + _MAX_RCPT_PER_TRANSACTION]
+            preamble = [_RSET_CMD, _MAIL_FROM_CMD] if start else [_MAIL_FROM_CMD]
+            rcpt_commands = [b'RCPT TO:<%s>\r\n' % email.encode('ascii') for email in batch]
             
-            # Коды 250 и 251 означают успех
-            if code == 250 or code == 251:
-                return True, "адрес существует"
+            if pipelining:
+                # RFC 2920: вся транзакция уходит одной записью, ответы читаются по порядку
+                writer.write(b''.join(preamble + rcpt_commands))
+                codes = [(await self._smtp_reply(reader))[0] for _ in preamble + rcpt_commands]
+                mail_code = codes[len(preamble) - 1]
+                rcpt_codes = codes[len(preamble):]
             else:
-                return False, f"адрес не найден (код {code})"
-                
-        except smtplib.SMTPServerDisconnected:
-            return False, "сервер разорвал соединение"
-        except smtplib.SMTPConnectError:
-            return False, "не удалось подключиться к серверу"
-        except Exception as e:
-            return False, f"ошибка SMTP: {str(e)[:50]}"
+                for command in preamble:
+                    writer.write(command)
+                    mail_code, _ = await self._smtp_reply(reader)
+                rcpt_codes = []
+            
+            if mail_code != 250:
+                raise _SMTPError(f"MAIL FROM отклонён (код {mail_code})")
+            
+            # Без PIPELINING RCPT отправляются только после принятого MAIL FROM
+            for command in rcpt_commands[len(rcpt_codes):]:
+                writer.write(command)
+                rcpt_codes.append((await self._smtp_reply(reader))[0])
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("RCPT через %s: %s", writer.get_extra_info('peername'),
+                             ', '.join(f'{e}={c}' for e, c in zip(batch, rcpt_codes)))
+            
+            # RCPT TO - проверяем существование получателей
+            for email, code in zip(batch, rcpt_codes):
+                # Коды 250 и 251 означают успех
+                if code == 250 or code == 251:
+                    results[email] = (True, "адрес существует", code)
+                else:
+                    results[email] = (False, f"адрес не найден (код {code})", code)
+        
+        writer.write(_QUIT_CMD)
+        await writer.drain()
+    
+    async def _smtp_reply(self, reader: asyncio.StreamReader) -> Tuple[int, List[bytes]]:
+        """
+        Чтение одного (возможно многострочного) ответа SMTP-сервера
+        
+        Returns:
+            (code, lines): код ответа и строки ответа
+        """
+        lines = []
+        while True:
+            line = await asyncio.wait_for(reader.readline(), self.timeout)
+            if not line:
+                raise ConnectionResetError("соединение закрыто сервером")
+            lines.append(line)
+            # "250-..." - ответ продолжается, "250 ..." - последняя строка
+            if line[3:4] != b'-':
+                return int(line[:3]), lines
     
     def validate_email(self, email: str) -> dict:
+        """Синхронная обёртка над validate_email_async"""
+        return asyncio.run(self.validate_email_async(email))
+    
+    async def validate_emails(self, emails: List[str]) -> List[dict]:
+        """
+        Параллельная проверка списка email-адресов
+        
+        MX-записи запрашиваются параллельно, затем адреса группируются по
+        основному MX-серверу и распределяются между несколькими (не более
+        _MAX_SESSIONS_PER_MX) SMTP-сессиями с этим сервером.
+        
+        Returns:
+            Список результатов в том же порядке, что и emails
+        """
+        results, fresh = await self._resolve_batch(emails)
+        await self._verify_batch(fresh)
+        
+        for result in fresh:
+            self._remember_result(result)
+        return self._copy_duplicates(emails, results)
+    
+    async def _resolve_batch(self, emails: List[str]) -> Tuple[List[dict], List[dict]]:
+        """
+        Первая фаза пакетной проверки: кэш, формат и MX-записи (без SMTP)
+        
+        Повторы внутри списка (без учёта регистра) проверяются один раз:
+        их позиции в results ссылаются на один и тот же dict, который после
+        SMTP-проверки разносится по копиям через _copy_duplicates.
+        
+        Returns:
+            (results, fresh): результаты для всех emails по порядку и уникальные
+            из них, что не взяты из кэша (их ещё нужно проверить через SMTP)
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+        
+        # Повторные и уже проверенные адреса берутся из кэша
+        results: List[Optional[dict]] = [self._cached_result(email) for email in emails]
+        fresh_indexes: Dict[str, List[int]] = {}
+        for i, result in enumerate(results):
+            if result is None:
+                fresh_indexes.setdefault(emails[i].lower(), []).append(i)
+        fresh_emails = [emails[indexes[0]] for indexes in fresh_indexes.values()]
+        
+        # Формат проверяется для всего списка сразу, DNS-задачи создаются только для корректных адресов
+        fresh = [
+            self._format_result(email, valid_format)
+            for email, valid_format in zip(fresh_emails, self.validate_formats(fresh_emails))
+        ]
+        for indexes, result in zip(fresh_indexes.values(), fresh):
+            for i in indexes:
+                results[i] = result
+        
+        async def limited(result: dict):
+            async with semaphore:
+                await self._check_mx(result)
+        
+        await asyncio.gather(*(limited(r) for r in fresh if r['valid_format']))
+        return results, fresh
+    
+    async def _verify_batch(self, results: List[dict], concurrency: int = _MAX_CONCURRENCY):
+        """
+        Вторая фаза пакетной проверки: SMTP для адресов с найденными MX-записями
+        
+        Args:
+            results: Результаты _resolve_batch; дополняются на месте
+            concurrency: Сколько SMTP-сессий может идти одновременно
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def verify(mx_host: str, group: List[dict]):
+            async with semaphore:
+                smtp_results = await self.smtp_verify_batch(mx_host, [r['email'] for r in group])
+            for result in group:
+                self._apply_smtp_result(result, mx_host, *smtp_results[result['email']])
+        
+        # На каждый MX - не больше _MAX_SESSIONS_PER_MX параллельных сессий,
+        # иначе крупные провайдеры (Gmail, Outlook) начинают тормозить наш IP
+        sessions = []
+        for mx_host, group in _group_by_mx(results).items():
+            session_count = min(_MAX_SESSIONS_PER_MX, len(group))
+            sessions.extend(verify(mx_host, group[i::session_count]) for i in range(session_count))
+        await asyncio.gather(*sessions)
+    
+    async def validate_email_async(self, email: str) -> dict:
         """
         Полная проверка email-адреса
         
         Returns:
             dict с результатами проверки
         """
+        cached = self._cached_result(email)
+        if cached is not None:
+            return cached
+        
+        result = await self._check_domain(email)
+        if result['domain_exists']:
+            # 3. SMTP Handshake - проверяем с первым MX-сервером
+            primary_mx = result['mx_records'][0]
+            smtp_result = (await self.smtp_verify_batch(primary_mx, [email]))[email]
+            self._apply_smtp_result(result, primary_mx, *smtp_result)
+        
+        self._remember_result(result)
+        return result
+    
+    @staticmethod
+    def _copy_duplicates(emails: List[str], results: List[dict]) -> List[dict]:
+        """Заменяет повторные ссылки на один результат копиями с исходным написанием адреса"""
+        seen = set()
+        for i, result in enumerate(results):
+            if id(result) in seen:
+                results[i] = EmailValidator._copy_result(result, emails[i])
+            else:
+                seen.add(id(result))
+        return results
+    
+    @staticmethod
+    def _copy_result(result: dict, email: str) -> dict:
+        """Копия результата для другого написания того же адреса"""
+        result = result.copy()
+        result['email'] = email
+        result['mx_records'] = list(result['mx_records'])
+        return result
+    
+    def _cached_result(self, email: str) -> Optional[dict]:
+        """Копия ранее сохранённого результата проверки или None"""
+        key = email.lower()
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        
+        expiry, result = cached
+        if expiry <= time.monotonic():
+            del self._result_cache[key]
+            return None
+        
+        self._result_cache.move_to_end(key)
+        return self._copy_result(result, email)
+    
+    def _remember_result(self, result: dict):
+        """
+        Сохранение результата проверки в кэш
+        
+        Кэшируются только однозначные ответы (нет MX, адрес подтверждён или
+        окончательно отклонён сервером кодом 5xx) и не дольше, чем закэширована
+        MX-запись домена.
+        """
+        if not result['valid_format']:
+            return  # формат проверяется быстрее, чем поиск в кэше
+        smtp_code = result['smtp_code']
+        if result['domain_exists'] and not (
+            result['smtp_check'] or (smtp_code is not None and 500 <= smtp_code <= 599)
+        ):
+            return  # ошибка соединения или временный отказ 4xx (greylisting) - ответ может измениться
+        
+        email = result['email']
+        mx_cached = self._mx_cache.get(email[email.rfind('@') + 1:].lower())
+        if mx_cached is None:
+            return
+        
+        expiry = min(mx_cached[0], time.monotonic() + _RESULT_CACHE_MAX_TTL)
+        key = email.lower()
+        self._result_cache[key] = (expiry, result.copy())
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > _RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+    
+    async def _check_domain(self, email: str) -> dict:
+        """
+        Проверка формата и MX-записей (без SMTP)
+        
+        Returns:
+            dict с результатами проверки; smtp_check ещё не заполнен
+        """
+        # 1. Проверка формата
+        result = self._format_result(email, self.validate_email_format(email))
+        if result['valid_format']:
+            # 2. Проверка MX-записей
+            await self._check_mx(result)
+        return result
+    
+    @staticmethod
+    def _format_result(email: str, valid_format: bool) -> dict:
+        """Начальный dict результата по итогам проверки формата"""
         result = {
             'email': email,
-            'valid_format': False,
+            'valid_format': valid_format,
             'domain_exists': False,
             'mx_records': [],
             'smtp_check': False,
+            'smtp_code': None,
             'status': '',
             'details': ''
         }
         
-        # 1. Проверка формата
-        if not self.validate_email_format(email):
+        if not valid_format:
             result['status'] = 'некорректный формат'
             result['details'] = 'email не соответствует стандартному формату'
-            return result
-        
-        result['valid_format'] = True
-        domain = email.split('@')[1]
-        
-        # 2. Проверка MX-записей
-        mx_records = self.get_mx_records(domain)
+        return result
+    
+    async def _check_mx(self, result: dict):
+        """Проверка MX-записей домена адреса с корректным форматом"""
+        email = result['email']
+        domain = email[email.rfind('@') + 1:]
+        mx_records = await self.get_mx_records(domain)
         
         if not mx_records:
             result['status'] = 'MX-записи отсутствуют или некорректны'
             result['details'] = f'домен {domain} не имеет MX-записей'
-            return result
+            return
         
         result['domain_exists'] = True
         result['mx_records'] = mx_records
-        
-        # 3. SMTP Handshake - проверяем с первым MX-сервером
-        primary_mx = mx_records[0]
-        smtp_valid, smtp_msg = self.smtp_verify(email, primary_mx)
+    
+    @staticmethod
+    def _apply_smtp_result(result: dict, mx_host: str, smtp_valid: bool, smtp_msg: str,
+                           smtp_code: Optional[int]):
+        """Запись результата SMTP-проверки в dict результата"""
         result['smtp_check'] = smtp_valid
+        result['smtp_code'] = smtp_code
         
         if smtp_valid:
             result['status'] = 'домен валиден'
-            result['details'] = f'адрес подтверждён через {primary_mx}'
+            result['details'] = f'адрес подтверждён через {mx_host}'
         else:
             result['status'] = 'домен валиден, но адрес не найден'
-            result['details'] = f'{smtp_msg} (проверено через {primary_mx})'
+            result['details'] = f'{smtp_msg} (проверено через {mx_host})'
+
+
+def _run_async(coro):
+    """Запуск корутины на uvloop (если установлен) или стандартном event loop"""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def _group_by_mx(results: List[dict]) -> DefaultDict[str, List[dict]]:
+    """Группировка результатов с найденными MX-записями по основному MX-серверу"""
+    by_mx: DefaultDict[str, List[dict]] = defaultdict(list)
+    for result in results:
+        if result['domain_exists']:
+            by_mx[result['mx_records'][0]].append(result)
+    return by_mx
+
+
+def _verify_shard(timeout: int, results: List[dict], concurrency: int) -> List[dict]:
+    """SMTP-проверка части адресов в отдельном процессе (со своим event loop)"""
+    _run_async(EmailValidator(timeout=timeout)._verify_batch(results, concurrency))
+    return results
+
+
+async def validate_emails_parallel(emails: List[str], timeout: int = 10,
+                                   workers: Optional[int] = None) -> List[dict]:
+    """
+    Проверка большого списка email-адресов в нескольких процессах
+    
+    Формат и MX-записи проверяются в текущем процессе, затем SMTP-проверка
+    делится на шарды по основному MX-серверу: все адреса одного MX попадают
+    в один процесс, поэтому лимит сессий на MX и общий лимит одновременных
+    сессий соблюдаются для всего списка, а не для каждого процесса отдельно.
+    
+    Проверка в основном ждёт сеть, а формат и DNS остаются в текущем процессе,
+    поэтому выигрыш есть, только когда разбор SMTP-ответов упирается в одно
+    ядро. main() этот режим не включает - только явный вызов.
+    
+    Args:
+        emails: Список адресов
+        timeout: Таймаут для SMTP-соединения (секунды)
+        workers: Число процессов (по умолчанию - число ядер)
         
-        return result
+    Returns:
+        Список результатов в том же порядке, что и emails
+    """
+    if not emails:
+        return []
+    
+    validator = EmailValidator(timeout=timeout)
+    results, fresh = await validator._resolve_batch(emails)
+    
+    # Крупные MX-группы раскладываются первыми - в наименее загруженный шард
+    groups = sorted(_group_by_mx(fresh).values(), key=len, reverse=True)
+    shards: List[List[dict]] = [[] for _ in range(min(workers or os.cpu_count() or 1, len(groups)))]
+    for group in groups:
+        min(shards, key=len).extend(group)
+    
+    if shards:
+        # Общий бюджет одновременных сессий делится между процессами
+        concurrency = max(1, _MAX_CONCURRENCY // len(shards))
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            shard_results = await asyncio.gather(*(
+                loop.run_in_executor(executor, _verify_shard, timeout, shard, concurrency)
+                for shard in shards
+            ))
+        
+        # В процессы уходят копии dict - переносим результаты SMTP обратно
+        for shard, shard_result in zip(shards, shard_results):
+            for result, verified in zip(shard, shard_result):
+                result.update(verified)
+    return validator._copy_duplicates(emails, results)
 
 
-def print_result(result: dict):
-    """Красивый вывод результата проверки"""
+def format_result(result: dict) -> str:
+    """Красивое форматирование результата проверки (блок строк с цветами)"""
     email = result['email']
     status = result['status']
     
@@ -155,15 +654,23 @@ def print_result(result: dict):
         color = Fore.RED
         icon = '❌'
     
-    print(f"\n{color}{icon} {email}")
-    print(f"{color}   Статус: {status}")
-    print(f"{color}   Детали: {result['details']}")
+    text = (
+        f"\n{color}{icon} {email}\n"
+        f"{color}   Статус: {status}\n"
+        f"{color}   Детали: {result['details']}\n"
+    )
     
     if result['mx_records']:
-        print(f"{Fore.CYAN}   MX-серверы: {', '.join(result['mx_records'][:3])}")
+        text += f"{Fore.CYAN}   MX-серверы: {', '.join(result['mx_records'][:3])}\n"
+    return text
+
 
+def print_result(result: dict):
+    """Красивый вывод результата проверки"""
+    sys.stdout.write(format_result(result))
 
-def main():
+
+async def main():
     """Основная функция - запуск валидатора"""
     
     print(f"{Fore.CYAN}{'='*70}")
@@ -185,17 +692,11 @@ def main():
     
     print(f"{Fore.WHITE}Проверяю {len(emails)} адресов...\n")
     
-    # Создаём валидатор
+    # Проверяем все email параллельно
     validator = EmailValidator(timeout=10)
-    
-    # Проверяем каждый email
-    results = []
-    for email in emails:
-        print(f"{Fore.WHITE}🔍 Проверяю: {email}...", end='')
-        result = validator.validate_email(email)
-        results.append(result)
-        print(f"\r{' '*80}\r", end='')  # Очищаем строку
-        print_result(result)
+    results = await validator.validate_emails(emails)
+    # Весь отчёт выводится одной записью, а не построчными print с flush
+    sys.stdout.write(''.join(map(format_result, results)))
     
     # Итоговая статистика
     print(f"\n{Fore.CYAN}{'='*70}")
@@ -209,4 +710,6 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    # uvloop - более быстрая реализация event loop (если установлена)
+    _run_async(main())
\ No newline at end of file
@@ -5,17 +5,56 @@ Telegram Sender - отправка текста из файла в Telegram-ча
 """
 
 import asyncio
+import mmap
 import os
+import time
 from pathlib import Path
+from typing import List, Optional
 from telegram import Bot
-from telegram.error import TelegramError
+from telegram.error import RetryAfter, TelegramError
+from telegram.request import HTTPXRequest
 from dotenv import load_dotenv
 from colorama import Fore, Style, init
 
+try:
+    import uvloop
+except ImportError:  # uvloop недоступен на Windows
+    uvloop = None
+
 # Инициализация
 init(autoreset=True)
 load_dotenv()
 
+# Пул HTTP/2-соединений переиспользуется между отправками (без повторного TLS-handshake)
+_CONNECTION_POOL_SIZE = 64
+# Лимит Telegram Bot API: не более ~30 сообщений в секунду суммарно по всем чатам
+# (в один чат - около 1 сообщения в секунду, поэтому в один чат шлём последовательно)
+_MAX_MESSAGES_PER_SECOND = 30
+# Сколько раз повторять отправку после RetryAfter (HTTP 429)
+_MAX_RETRIES = 5
+# Файлы больше этого размера читаются через mmap (байты)
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+def read_text_file(file_path: str) -> str:
+    """
+    Чтение UTF-8 файла с обрезкой пробелов по краям
+    
+    Переводы строк приводятся к '\\n', как при чтении в текстовом режиме.
+    Большие файлы декодируются прямо из mmap, без промежуточной копии байтов.
+    """
+    path = Path(file_path)
+    if path.stat().st_size <= _MMAP_THRESHOLD:
+        text = path.read_bytes().decode('utf-8')
+    else:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            text = str(m, 'utf-8')
+    
+    # Файлы, сохранённые в Windows (\r\n) или старом macOS (\r)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text.strip()
+
 
 class TelegramSender:
     """Класс для отправки сообщений в Telegram через бота"""
@@ -26,30 +65,45 @@ class TelegramSender:
             bot_token: Токен Telegram-бота (от @BotFather)
             chat_id: ID чата для отправки (можно получить от @userinfobot)
         """
-        self.bot = Bot(token=bot_token)
+        self.bot = Bot(
+            token=bot_token,
+            request=HTTPXRequest(connection_pool_size=_CONNECTION_POOL_SIZE, http_version='2'),
+        )
         self.chat_id = chat_id
     
-    async def send_message(self, text: str) -> bool:
+    async def send_message(self, text: str, chat_id: Optional[str] = None) -> bool:
         """
         Отправка текстового сообщения в чат
         
+        При превышении лимита Telegram (RetryAfter) ждёт указанное время и повторяет.
+        
         Args:
             text: Текст сообщения для отправки
+            chat_id: ID чата (по умолчанию - чат из конструктора)
             
         Returns:
             True если отправлено успешно
         """
+        chat_id = chat_id or self.chat_id
         try:
-            # Отправляем сообщение
-            message = await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=text,
-                parse_mode='Markdown'  # Поддержка Markdown форматирования
-            )
+            for attempt in range(_MAX_RETRIES + 1):
+                try:
+                    # Отправляем сообщение
+                    message = await self.bot.send_message(
+                        chat_id=chat_id,
+                        text=text,
+                        parse_mode='Markdown'  # Поддержка Markdown форматирования
+                    )
+                    break
+                except RetryAfter as e:
+                    if attempt == _MAX_RETRIES:
+                        raise
+                    print(f"{Fore.YELLOW}⏳ Лимит Telegram, повтор через {e.retry_after} сек.")
+                    await asyncio.sleep(e.retry_after)
             
             print(f"{Fore.GREEN}✅ Сообщение отправлено успешно!")
             print(f"{Fore.CYAN}   Message ID: {message.message_id}")
-            print(f"{Fore.CYAN}   Chat ID: {self.chat_id}")
+            print(f"{Fore.CYAN}   Chat ID: {chat_id}")
             print(f"{Fore.CYAN}   Длина текста: {len(text)} символов")
             return True
             
@@ -60,6 +114,43 @@ class TelegramSender:
             print(f"{Fore.RED}❌ Неожиданная ошибка: {e}")
             return False
     
+    async def send_many(self, texts: List[str]) -> List[bool]:
+        """
+        Отправка нескольких сообщений в чат по порядку через общий пул соединений
+        
+        Args:
+            texts: Тексты сообщений для отправки
+            
+        Returns:
+            Список флагов успеха в том же порядке, что и texts
+        """
+        # Последовательно: сообщения приходят в чат в исходном порядке,
+        # а лимит на один чат (~1 сообщение/сек) соблюдается через RetryAfter
+        return [await self.send_message(text) for text in texts]
+    
+    async def send_to_chats(self, chat_ids: List[str], text: str) -> List[bool]:
+        """
+        Параллельная отправка одного сообщения в несколько разных чатов
+        
+        Args:
+            chat_ids: ID чатов для отправки
+            text: Текст сообщения
+            
+        Returns:
+            Список флагов успеха в том же порядке, что и chat_ids
+        """
+        semaphore = asyncio.Semaphore(_MAX_MESSAGES_PER_SECOND)
+        
+        async def limited(chat_id: str) -> bool:
+            async with semaphore:
+                started = time.monotonic()
+                success = await self.send_message(text, chat_id=chat_id)
+                # Слот освобождается не раньше чем через секунду - не больше 30 сообщений/сек
+                await asyncio.sleep(max(0.0, 1.0 - (time.monotonic() - started)))
+                return success
+        
+        return await asyncio.gather(*(limited(chat_id) for chat_id in chat_ids))
+    
     async def send_from_file(self, file_path: str) -> bool:
         """
         Чтение текста из файла и отправка в Telegram
@@ -72,8 +163,7 @@ class TelegramSender:
         """
         try:
             # Читаем файл
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read().strip()
+            text = read_text_file(file_path)
             
             if not text:
                 print(f"{Fore.YELLOW}⚠️  Файл {file_path} пуст!")
@@ -172,5 +262,8 @@ async def main():
 
 
 if __name__ == '__main__':
-    # Запускаем асинхронную функцию
-    asyncio.run(main())
\ No newline at end of file
+    # Запускаем асинхронную функцию (на uvloop, если он установлен)
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file